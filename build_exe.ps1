@@ -35,11 +35,13 @@ $args = @(
     "--onefile",
     "--name", "VisionAssistanceApp",
     "--collect-all", "google.genai",
-    "--collect-all", "pyautogui",
+    "--collect-all", "mss",
     "--collect-all", "pyttsx3",
     "--collect-all", "cryptography",
+    "--collect-all", "h2",
     "--hidden-import", "pyttsx3.drivers",
     "--hidden-import", "pyttsx3.drivers.sapi5",
+    "--hidden-import", "win32com.client",
     "--add-data", "config.example.json;."
 )
 
@@ -14,8 +14,8 @@ automatically encrypts it on first use to avoid accidental misuse.
 Dependencies:
     - google‑genai (for calling Gemini models)
     - cryptography (for symmetric encryption of API keys)
-    - keyboard (for global hot‑key registration)
-    - pyautogui (for taking screenshots)
+    - mss (for taking screenshots)
+    - Pillow (for encoding screenshots)
     - pyttsx3 (for speech synthesis)
 
 All of these packages must be installed in your Python environment
@@ -32,37 +32,55 @@ request a screen description or CTRL+SHIFT+Q to exit.
 Copyright 2026, Vision Assistance Project
 """
 
-import io
+import atexit
+import ctypes
 import json
 import logging
+import logging.handlers
+import functools
 import getpass
-import msvcrt
+import io
 import os
+import queue
 import re
 import subprocess
 import sys
 import tempfile
 import threading
 import time
+import urllib.parse
 import wave
 import winsound
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
 from pathlib import Path
 
 # External libraries – these imports will fail if the appropriate
 # dependencies are not installed. See requirements.txt for details.
 try:
-    import keyboard  # type: ignore
-    import pyautogui  # type: ignore
+    import mss  # type: ignore
     import pyttsx3  # type: ignore
+    import httpx  # type: ignore
     from cryptography.fernet import Fernet  # type: ignore
     from google import genai  # type: ignore
     from google.genai import types  # type: ignore
+    from PIL import Image  # type: ignore
 except ImportError as exc:
     missing = exc.name if hasattr(exc, 'name') else str(exc)
     print(f"Error: Missing dependency '{missing}'. Please install all "
           f"requirements listed in requirements.txt before running this script.")
     sys.exit(1)
 
+# pywin32 is installed alongside pyttsx3 on Windows. When it is missing the
+# in-process SAPI speech backend is skipped and subprocess backends are used.
+try:
+    import pythoncom  # type: ignore
+    import win32com.client  # type: ignore
+except ImportError:
+    pythoncom = None
+    win32com = None
+
 
 # ---------------------------------------------------------------------------
 # Configuration handling
@@ -75,10 +93,12 @@ except ImportError as exc:
 # In source mode we keep files next to main.py.
 # In bundled (.exe) mode we store runtime files under %APPDATA%
 # so data persists across launches and is writable without admin rights.
+# Path lookups are memoized so the directory write probe runs only once.
 
 
+@functools.lru_cache(maxsize=None)
 def get_runtime_dir() -> Path:
-    """Return the writable directory for config, logs, and lock files."""
+    """Return the writable directory for config and log files."""
     if getattr(sys, "frozen", False):
         appdata_root = Path(
             os.environ.get("APPDATA", str(Path.home() / "AppData" / "Roaming"))
@@ -90,6 +110,7 @@ def get_runtime_dir() -> Path:
     return runtime_dir
 
 
+@functools.lru_cache(maxsize=None)
 def get_executable_dir() -> Path:
     """Return executable directory in EXE mode, script directory otherwise."""
     if getattr(sys, "frozen", False):
@@ -97,6 +118,7 @@ def get_executable_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
+@functools.lru_cache(maxsize=None)
 def is_directory_writable(directory: Path) -> bool:
     """Return True if directory is writable by current user."""
     try:
@@ -110,6 +132,7 @@ def is_directory_writable(directory: Path) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_path(runtime_dir: Path, executable_dir: Path) -> Path:
     """Pick config location: EXE folder when writable, else runtime dir."""
     if getattr(sys, "frozen", False) and is_directory_writable(executable_dir):
@@ -122,40 +145,50 @@ EXECUTABLE_DIR = get_executable_dir()
 CONFIG_PATH = get_config_path(RUNTIME_DIR, EXECUTABLE_DIR)
 LOG_PATH = EXECUTABLE_DIR / "app.log"
 FALLBACK_LOG_PATH = RUNTIME_DIR / "app.log"
-LOCK_PATH = RUNTIME_DIR / ".vision_assistant.lock"
+# The Local\ prefix scopes the mutex to the user session, like the hot-keys.
+INSTANCE_MUTEX_NAME = "Local\\VisionAssistanceAppInstance"
+
+
+ERROR_ALREADY_EXISTS = 183
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_kernel32.CreateMutexW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.LPCWSTR]
+_kernel32.CreateMutexW.restype = wintypes.HANDLE
+_kernel32.ReleaseMutex.argtypes = [wintypes.HANDLE]
+_kernel32.ReleaseMutex.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+_kernel32.CloseHandle.restype = wintypes.BOOL
 
 
 class SingleInstanceLock:
-    """Prevent multiple app instances from running at the same time."""
+    """Prevent multiple app instances from running at the same time.
 
-    def __init__(self, lock_path: Path) -> None:
-        self.lock_path = lock_path
+    Uses a named kernel mutex, which Windows releases automatically if the
+    process dies, so no lock file is left behind.
+    """
+
+    def __init__(self, mutex_name: str) -> None:
+        self.mutex_name = mutex_name
         self._handle = None
 
     def acquire(self) -> bool:
-        self._handle = open(self.lock_path, "a+b")
-        self._handle.seek(0)
-        try:
-            msvcrt.locking(self._handle.fileno(), msvcrt.LK_NBLCK, 1)
-            if not self._handle.read(1):
-                self._handle.seek(0)
-                self._handle.write(b"1")
-                self._handle.flush()
-            return True
-        except OSError:
-            self._handle.close()
-            self._handle = None
+        handle = _kernel32.CreateMutexW(None, True, self.mutex_name)
+        if not handle:
+            logging.error(
+                f"Failed to create instance mutex (error {ctypes.get_last_error()})."
+            )
+            return False
+        if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            _kernel32.CloseHandle(handle)
             return False
+        self._handle = handle
+        return True
 
     def release(self) -> None:
         if not self._handle:
             return
-        try:
-            self._handle.seek(0)
-            msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
-        except OSError:
-            pass
-        self._handle.close()
+        _kernel32.ReleaseMutex(self._handle)
+        _kernel32.CloseHandle(self._handle)
         self._handle = None
 
 
@@ -172,22 +205,23 @@ def load_config() -> dict:
         default_conf = {
             "api_key": "",
             "encrypted_key": "",
-            "encryption_key": ""
+            "encryption_key": "",
+            "max_screenshot_edge": DEFAULT_MAX_SCREENSHOT_EDGE,
         }
-        CONFIG_PATH.write_text(json.dumps(default_conf, indent=4))
+        save_config(default_conf)
         return default_conf
     try:
-        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(CONFIG_PATH.read_bytes())
     except Exception as e:
         print(f"Failed to read config file: {e}")
         return {}
 
 
 def save_config(conf: dict) -> None:
-    """Persist the configuration back to disk."""
-    with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-        json.dump(conf, f, indent=4)
+    """Persist the configuration back to disk as compact JSON."""
+    CONFIG_PATH.write_text(
+        json.dumps(conf, separators=(',', ':')), encoding='utf-8'
+    )
 
 
 def configure_logging() -> Path:
@@ -205,15 +239,33 @@ def configure_logging() -> Path:
             handlers.append(logging.FileHandler(FALLBACK_LOG_PATH, encoding='utf-8'))
         except Exception:
             pass
+    # Callers only enqueue records; a background listener does the file I/O.
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    # QueueHandler.prepare() bakes its own formatter into the record, so it
+    # must pass the bare message through for the file handlers to format.
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=handlers,
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)],
         force=True,
     )
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     return chosen_log_path
 
 
+@functools.lru_cache(maxsize=4)
+def _get_fernet(fernet_key: str) -> Fernet:
+    """Return a cached Fernet instance so its key is decoded only once."""
+    return Fernet(fernet_key.encode('utf-8'))
+
+
 def encrypt_api_key(api_key: str) -> tuple[str, str]:
     """Encrypt an API key and return both the ciphertext and the key used.
 
@@ -228,10 +280,9 @@ def encrypt_api_key(api_key: str) -> tuple[str, str]:
         A tuple of the encrypted key (base64 string) and the base64
         representation of the Fernet key used for encryption.
     """
-    key = Fernet.generate_key()
-    cipher_suite = Fernet(key)
-    encrypted = cipher_suite.encrypt(api_key.encode('utf-8'))
-    return encrypted.decode('utf-8'), key.decode('utf-8')
+    key = Fernet.generate_key().decode('utf-8')
+    encrypted = _get_fernet(key).encrypt(api_key.encode('utf-8'))
+    return encrypted.decode('utf-8'), key
 
 
 def decrypt_api_key(encrypted_key: str, fernet_key: str) -> str:
@@ -249,8 +300,7 @@ def decrypt_api_key(encrypted_key: str, fernet_key: str) -> str:
     str
         The decrypted plaintext API key.
     """
-    cipher_suite = Fernet(fernet_key.encode('utf-8'))
-    decrypted = cipher_suite.decrypt(encrypted_key.encode('utf-8'))
+    decrypted = _get_fernet(fernet_key).decrypt(encrypted_key.encode('utf-8'))
     return decrypted.decode('utf-8')
 
 
@@ -282,13 +332,14 @@ def get_api_key(conf: dict) -> str | None:
             logging.error(f"Error decrypting API key: {e}")
             return None
     if plain:
-        # Encrypt and persist
-        encrypted_key, key = encrypt_api_key(plain)
+        # Encrypt and persist, then return the key we already hold.
+        cleaned = plain.strip()
+        encrypted_key, key = encrypt_api_key(cleaned)
         conf['encrypted_key'] = encrypted_key
         conf['encryption_key'] = key
         conf['api_key'] = ""
         save_config(conf)
-        return decrypt_api_key(encrypted_key, key)
+        return cleaned
     return None
 
 
@@ -363,6 +414,94 @@ def init_speech_engine() -> pyttsx3.Engine:
     return engine
 
 
+# SpeechVoiceSpeakFlags from the SAPI 5 automation interface.
+SVSF_ASYNC = 1
+SVSF_PURGE_BEFORE_SPEAK = 2
+
+_SAPI_VOICE = None
+_SAPI_UNAVAILABLE = False
+_SAPI_LOCK = threading.Lock()
+_COM_STATE = threading.local()
+
+
+def _ensure_com_initialized() -> None:
+    """Join the COM multithreaded apartment once per calling thread."""
+    if getattr(_COM_STATE, "initialized", False):
+        return
+    try:
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    except pythoncom.com_error:
+        # Thread already joined an apartment (e.g. via pyttsx3); reuse it.
+        pass
+    _COM_STATE.initialized = True
+
+
+def get_sapi_voice():
+    """Return the shared in-process SAPI voice, or None if unavailable."""
+    global _SAPI_VOICE, _SAPI_UNAVAILABLE
+    if win32com is None or _SAPI_UNAVAILABLE:
+        return None
+    _ensure_com_initialized()
+    with _SAPI_LOCK:
+        if _SAPI_VOICE is None:
+            try:
+                voice = win32com.client.Dispatch("SAPI.SpVoice")
+                voice.Volume = 100
+                voice.Rate = -1
+                _SAPI_VOICE = voice
+            except Exception as exc:
+                logging.error(f"SAPI voice unavailable: {exc}")
+                _SAPI_UNAVAILABLE = True
+        return _SAPI_VOICE
+
+
+def purge_sapi_speech() -> None:
+    """Stop in-process SAPI playback and discard its pending text."""
+    if _SAPI_VOICE is None:
+        return
+    try:
+        _ensure_com_initialized()
+        _SAPI_VOICE.Speak("", SVSF_ASYNC | SVSF_PURGE_BEFORE_SPEAK)
+    except Exception as exc:
+        logging.error(f"Failed to purge SAPI speech: {exc}")
+
+
+# SAPI voice script for the cscript backend; text is read from stdin.
+VBS_SPEECH_SCRIPT = (
+    'Set voice = CreateObject("SAPI.SpVoice")\n'
+    'Set audio = CreateObject("SAPI.SpMMAudioOut")\n'
+    "audio.DeviceId = 0\n"
+    "audio.Volume = 100\n"
+    "Set voice.AudioOutputStream = audio\n"
+    "voice.Volume = 100\n"
+    "voice.Rate = -1\n"
+    "text = WScript.StdIn.ReadAll\n"
+    "voice.Speak text\n"
+)
+
+# Long-lived PowerShell synthesizer: each stdin line holds a URL-encoded
+# output path and utterance separated by a tab; it replies "ok" or "error".
+WAVE_WORKER_SCRIPT = (
+    "Add-Type -AssemblyName System.Speech; "
+    "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
+    "$s.Volume = 100; "
+    "$s.Rate = -1; "
+    "while (($line = [Console]::In.ReadLine()) -ne $null) { "
+    "  try { "
+    "    $parts = $line.Split([char]9, 2); "
+    "    $s.SetOutputToWaveFile([Uri]::UnescapeDataString($parts[0])); "
+    "    $s.Speak([Uri]::UnescapeDataString($parts[1])); "
+    "    $s.SetOutputToNull(); "
+    "    [Console]::Out.WriteLine('ok') "
+    "  } catch { "
+    "    $s.SetOutputToNull(); "
+    "    [Console]::Out.WriteLine('error') "
+    "  }; "
+    "  [Console]::Out.Flush() "
+    "}"
+)
+
+
 def speak(
     engine: pyttsx3.Engine,
     text: str,
@@ -370,17 +509,62 @@ def speak(
     repeat: int = 1,
 ) -> None:
     """Speak the given text asynchronously."""
-    # Serialize all speech calls to avoid overlapping narration.
-    if not hasattr(speak, "_lock"):
-        speak._lock = threading.Lock()
-    if not hasattr(speak, "_active_ps"):
-        speak._active_ps = None
-    if not hasattr(speak, "_active_proc"):
-        speak._active_proc = None
-    if not hasattr(speak, "_vbs_path"):
-        speak._vbs_path = None
-    if not hasattr(speak, "_stop_event"):
-        speak._stop_event = threading.Event()
+    def _synthesize_with_wave_worker(utterance: str, wav_path: str) -> bool:
+        """Render speech to a WAV file using the long-lived synth process."""
+        worker = speak._wave_worker
+        try:
+            if worker is None or worker.poll() is not None:
+                worker = subprocess.Popen(
+                    ["powershell", "-NoProfile", "-Command", WAVE_WORKER_SCRIPT],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                )
+                speak._wave_worker = worker
+            request = (
+                f"{urllib.parse.quote(wav_path, safe='')}\t"
+                f"{urllib.parse.quote(utterance, safe='')}\n"
+            )
+            worker.stdin.write(request)
+            worker.stdin.flush()
+            reply = worker.stdout.readline().strip()
+        except (OSError, ValueError) as exc:
+            logging.error(f"Wave synthesis worker failed: {exc}")
+            reply = ""
+        if reply == "ok":
+            return True
+        if reply == "":
+            # Worker exited or its pipes broke; restart it on next use.
+            if worker is not None:
+                try:
+                    worker.kill()
+                except Exception:
+                    pass
+            speak._wave_worker = None
+        else:
+            logging.error("Wave synthesis worker could not render utterance.")
+        return False
+
+    def _speak_via_sapi(utterance: str) -> bool:
+        if speak._stop_event.is_set():
+            return True
+        voice = get_sapi_voice()
+        if voice is None:
+            return False
+        try:
+            voice.Speak(utterance, SVSF_ASYNC | SVSF_PURGE_BEFORE_SPEAK)
+            # Returns early when another thread purges the voice.
+            voice.WaitUntilDone(-1)
+        except Exception as exc:
+            logging.error(f"SAPI speech failed: {exc}")
+            return False
+        if speak._stop_event.is_set():
+            logging.info("Speech interrupted during SAPI playback.")
+            return True
+        logging.info("Speech backend: sapi")
+        return True
 
     def _speak_via_pyttsx3(utterance: str) -> None:
         if speak._stop_event.is_set():
@@ -391,22 +575,12 @@ def speak(
         engine.runAndWait()
 
     def _ensure_vbs_script() -> str:
-        vbs_code = (
-            'Set voice = CreateObject("SAPI.SpVoice")\n'
-            'Set audio = CreateObject("SAPI.SpMMAudioOut")\n'
-            "audio.DeviceId = 0\n"
-            "audio.Volume = 100\n"
-            "Set voice.AudioOutputStream = audio\n"
-            "voice.Volume = 100\n"
-            "voice.Rate = -1\n"
-            "text = WScript.StdIn.ReadAll\n"
-            "voice.Speak text\n"
-        )
+        # Written once per process; later calls reuse the same file.
         if not speak._vbs_path:
             fd, script_path = tempfile.mkstemp(suffix=".vbs", prefix="vision_speech_")
             os.close(fd)
+            Path(script_path).write_text(VBS_SPEECH_SCRIPT, encoding="utf-8")
             speak._vbs_path = script_path
-        Path(speak._vbs_path).write_text(vbs_code, encoding="utf-8")
         return speak._vbs_path
 
     def _speak_via_cscript(utterance: str) -> bool:
@@ -474,8 +648,8 @@ def speak(
     def _speak_via_wave_file(utterance: str) -> bool:
         if speak._stop_event.is_set():
             return True
-        fd, wav_path = tempfile.mkstemp(suffix=".wav", prefix="vision_tts_")
-        os.close(fd)
+        # One WAV path per process, overwritten by each utterance.
+        wav_path = speak._wav_path
         command = (
             "Add-Type -AssemblyName System.Speech; "
             "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
@@ -488,19 +662,21 @@ def speak(
             "$s.Dispose();"
         )
         try:
-            proc = subprocess.run(
-                ["powershell", "-NoProfile", "-Command", command],
-                input=utterance,
-                text=True,
-                capture_output=True,
-                env={**os.environ, "VISION_TTS_WAV_PATH": wav_path},
-            )
-            if proc.returncode != 0:
-                logging.error(
-                    f"Wave synthesis failed (rc={proc.returncode}): "
-                    f"{proc.stderr.strip()}"
+            if not _synthesize_with_wave_worker(utterance, wav_path):
+                # One-shot fallback when the persistent worker is unusable.
+                proc = subprocess.run(
+                    ["powershell", "-NoProfile", "-Command", command],
+                    input=utterance,
+                    text=True,
+                    capture_output=True,
+                    env={**os.environ, "VISION_TTS_WAV_PATH": wav_path},
                 )
-                return False
+                if proc.returncode != 0:
+                    logging.error(
+                        f"Wave synthesis failed (rc={proc.returncode}): "
+                        f"{proc.stderr.strip()}"
+                    )
+                    return False
             if speak._stop_event.is_set():
                 return True
             try:
@@ -516,27 +692,23 @@ def speak(
                 wav_path,
                 winsound.SND_FILENAME | winsound.SND_ASYNC,
             )
-            deadline = time.time() + duration_seconds + 0.15
-            while time.time() < deadline:
-                if speak._stop_event.is_set():
-                    winsound.PlaySound(None, winsound.SND_PURGE)
-                    logging.info("Speech interrupted during wave playback.")
-                    return True
-                time.sleep(0.05)
+            # Block until playback ends or the user stops speech, whichever
+            # comes first; the stop event wakes this wait immediately.
+            if speak._stop_event.wait(duration_seconds + 0.15):
+                winsound.PlaySound(None, winsound.SND_PURGE)
+                logging.info("Speech interrupted during wave playback.")
+                return True
             logging.info("Speech backend: wave-file")
             return True
         except Exception as exc:
             logging.error(f"Wave playback failed: {exc}")
             return False
-        finally:
-            try:
-                os.remove(wav_path)
-            except OSError:
-                pass
 
     if speak._stop_event.is_set():
         logging.info("Speech suppressed due to active user stop request.")
         return
+    if interrupt:
+        purge_sapi_speech()
     if interrupt and speak._active_proc is not None:
         try:
             speak._active_proc.terminate()
@@ -544,6 +716,10 @@ def speak(
             pass
     with speak._lock:
         for _ in range(max(1, repeat)):
+            if speak._stop_event.is_set():
+                break
+            if _speak_via_sapi(text):
+                continue
             if speak._stop_event.is_set():
                 break
             if _speak_via_wave_file(text):
@@ -557,20 +733,42 @@ def speak(
             _speak_via_powershell(text)
 
 
+# Shared speech state, initialised once so the per-utterance path has no
+# setup checks. The lock serializes all speech to avoid overlapping narration.
+speak._lock = threading.Lock()
+speak._active_ps = None
+speak._active_proc = None
+speak._vbs_path = None
+speak._wave_worker = None
+speak._wav_path = os.path.join(
+    tempfile.gettempdir(), f"vision_tts_{os.getpid()}.wav"
+)
+speak._stop_event = threading.Event()
+
+
+def remove_speech_temp_files() -> None:
+    """Delete the per-process WAV and VBS files used by speech backends."""
+    for path in (speak._wav_path, speak._vbs_path):
+        if not path:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+atexit.register(remove_speech_temp_files)
+
+
 def clear_speech_stop_request() -> None:
     """Allow future speech output after a user-triggered stop."""
-    if not hasattr(speak, "_stop_event"):
-        speak._stop_event = threading.Event()
     speak._stop_event.clear()
 
 
 def stop_current_speech(engine: pyttsx3.Engine | None = None) -> None:
     """Immediately interrupt active speech and suppress pending narration."""
-    if not hasattr(speak, "_stop_event"):
-        speak._stop_event = threading.Event()
-    if not hasattr(speak, "_active_proc"):
-        speak._active_proc = None
     speak._stop_event.set()
+    purge_sapi_speech()
     active_proc = speak._active_proc
     if active_proc is not None:
         try:
@@ -599,19 +797,61 @@ def safe_beep(frequency: int = 1000, duration_ms: int = 80) -> None:
             pass
 
 
-def play_beep_pattern(pattern: list[tuple[int, int]], async_mode: bool = True) -> None:
+# Asynchronous beep patterns are played in order by one long-lived worker
+# instead of a new thread per cue.
+_AUDIO_CUE_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_AUDIO_CUE_THREAD: threading.Thread | None = None
+_AUDIO_CUE_LOCK = threading.Lock()
+
+
+# (frequency, duration_ms) cue patterns, shared so hot-key handlers do not
+# rebuild them on every press.
+_BEEP_ERROR = ((420, 90), (380, 90), (340, 90))
+_BEEP_BUSY = ((420, 90), (380, 90))
+_BEEP_CAPTURE = ((740, 60), (900, 70))
+_BEEP_FOLLOW_UP = ((760, 60), (1040, 80))
+_BEEP_SPEECH_STOPPED = ((500, 70), (420, 90))
+_BEEP_TASK_CANCELED = ((460, 70), (390, 90), (320, 110))
+_BEEP_PROCESSING = ((1100, 70),)
+_BEEP_RESPONSE_READY = ((1250, 90), (1500, 120))
+_BEEP_API_KEY_PROMPT = ((950, 70), (1200, 90))
+_BEEP_API_KEY_SAVED = ((1200, 90), (1450, 120))
+_BEEP_RECORDING_SUBMIT = ((980, 90), (1180, 110))
+_BEEP_RECORDING_START = ((1320, 140), (1560, 170))
+_BEEP_RECORDING_END = ((900, 80), (1060, 100))
+
+
+def _run_beep_pattern(pattern: Sequence[tuple[int, int]]) -> None:
+    for freq, duration in pattern:
+        safe_beep(freq, duration)
+        time.sleep(0.04)
+
+
+def _audio_cue_worker() -> None:
+    while True:
+        _run_beep_pattern(_AUDIO_CUE_QUEUE.get())
+
+
+def play_beep_pattern(
+    pattern: Sequence[tuple[int, int]],
+    async_mode: bool = True,
+) -> None:
     """Play a sequence of (frequency, duration_ms) beeps."""
-    def _run() -> None:
-        for freq, duration in pattern:
-            safe_beep(freq, duration)
-            time.sleep(0.04)
-    if async_mode:
-        threading.Thread(target=_run, daemon=True).start()
-    else:
-        _run()
+    global _AUDIO_CUE_THREAD
+    if not async_mode:
+        _run_beep_pattern(pattern)
+        return
+    with _AUDIO_CUE_LOCK:
+        if _AUDIO_CUE_THREAD is None:
+            _AUDIO_CUE_THREAD = threading.Thread(target=_audio_cue_worker, daemon=True)
+            _AUDIO_CUE_THREAD.start()
+    _AUDIO_CUE_QUEUE.put(pattern)
 
 
-def play_audio_cue(sound_alias: str, fallback_pattern: list[tuple[int, int]]) -> None:
+def play_audio_cue(
+    sound_alias: str,
+    fallback_pattern: Sequence[tuple[int, int]],
+) -> None:
     """Play a clearly audible cue sound, falling back to tone beeps."""
     try:
         winsound.PlaySound(sound_alias, winsound.SND_ALIAS | winsound.SND_SYNC)
@@ -622,7 +862,8 @@ def play_audio_cue(sound_alias: str, fallback_pattern: list[tuple[int, int]]) ->
 def play_working_tick() -> None:
     """Play a short periodic tick while AI processing is active."""
     try:
-        winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS | winsound.SND_SYNC)
+        # Async so the progress loop's wait covers the full tick interval.
+        winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS | winsound.SND_ASYNC)
     except Exception:
         safe_beep(980, 70)
 
@@ -638,17 +879,23 @@ def start_progress_beep_loop(stop_event: threading.Event) -> threading.Thread:
     return thread
 
 
+def stop_progress_beep_loop(
+    stop_event: threading.Event | None,
+    thread: threading.Thread | None,
+) -> None:
+    """Stop progress ticks started by ``start_progress_beep_loop``."""
+    if stop_event is not None:
+        stop_event.set()
+    if thread is not None:
+        thread.join(timeout=0.2)
+
+
 def transcribe_from_microphone(
     timeout_seconds: int = 8,
     cancel_event: threading.Event | None = None,
     stop_event: threading.Event | None = None,
 ) -> str | None:
     """Capture short dictation from default microphone via Windows speech API."""
-    if not hasattr(transcribe_from_microphone, "_active_proc_lock"):
-        transcribe_from_microphone._active_proc_lock = threading.Lock()
-    if not hasattr(transcribe_from_microphone, "_active_proc"):
-        transcribe_from_microphone._active_proc = None
-
     script = (
         "Add-Type -AssemblyName System.Speech; "
         "$recognizer = New-Object System.Speech.Recognition.SpeechRecognitionEngine; "
@@ -670,7 +917,10 @@ def transcribe_from_microphone(
         )
         with transcribe_from_microphone._active_proc_lock:
             transcribe_from_microphone._active_proc = proc
-        deadline = time.time() + max(timeout_seconds + 5, 12)
+        deadline = time.monotonic() + max(timeout_seconds + 5, 12)
+        # The cancel hot-key sets the submit event as well, so waiting on it
+        # wakes the poll loop at once for either key.
+        wake_event = stop_event if stop_event is not None else cancel_event
         while proc.poll() is None:
             if cancel_event is not None and cancel_event.is_set():
                 try:
@@ -686,14 +936,17 @@ def transcribe_from_microphone(
                     pass
                 logging.info("Microphone transcription stopped by user submit.")
                 return None
-            if time.time() > deadline:
+            if time.monotonic() > deadline:
                 try:
                     proc.terminate()
                 except Exception:
                     pass
                 logging.error("Microphone transcription timed out.")
                 return None
-            time.sleep(0.05)
+            if wake_event is not None:
+                wake_event.wait(0.05)
+            else:
+                time.sleep(0.05)
         stdout_text, stderr_text = proc.communicate()
         if stop_event is not None and stop_event.is_set():
             return None
@@ -713,10 +966,12 @@ def transcribe_from_microphone(
             transcribe_from_microphone._active_proc = None
 
 
+transcribe_from_microphone._active_proc_lock = threading.Lock()
+transcribe_from_microphone._active_proc = None
+
+
 def cancel_active_transcription() -> None:
     """Cancel active microphone transcription process if running."""
-    if not hasattr(transcribe_from_microphone, "_active_proc_lock"):
-        return
     with transcribe_from_microphone._active_proc_lock:
         active_proc = transcribe_from_microphone._active_proc
     if active_proc is None:
@@ -729,111 +984,331 @@ def cancel_active_transcription() -> None:
         logging.error(f"Failed to cancel microphone transcription: {exc}")
 
 
+# ---------------------------------------------------------------------------
+# Screen capture
+#
+# Each worker thread keeps its own mss instance (GDI device contexts are
+# thread-bound), reused across captures so its buffers are allocated once
+# per thread rather than on every hot-key.
+# Frames are uploaded as JPEG, which is several times smaller than PNG
+# for typical desktops; mostly flat screens keep PNG so text stays crisp.
+
+_SCT_LOCAL = threading.local()
+JPEG_QUALITY = 85
+PNG_COMPRESS_LEVEL = 1
+# Long edge of Gemini's internal image tiles; larger frames are downscaled.
+DEFAULT_MAX_SCREENSHOT_EDGE = 1568
+FLAT_SCREEN_RATIO = 0.6
+
+
+def _is_flat_screen(image: Image.Image) -> bool:
+    """Return True when one tone dominates a coarse grayscale sample."""
+    sample = image.reduce(16).convert("L")
+    histogram = sample.histogram()
+    total = sample.width * sample.height
+    return bool(total) and max(histogram) / total >= FLAT_SCREEN_RATIO
+
+
+def grab_screenshot(
+    max_edge: int = DEFAULT_MAX_SCREENSHOT_EDGE,
+) -> tuple[bytes, str]:
+    """Capture all monitors and return encoded image bytes and MIME type.
+
+    Frames whose long edge exceeds ``max_edge`` pixels are downscaled
+    first; Gemini resizes large images anyway, so sending full resolution
+    only costs upload time. A ``max_edge`` of 0 or less keeps full size.
+    """
+    sct = getattr(_SCT_LOCAL, "sct", None)
+    if sct is None:
+        sct = _SCT_LOCAL.sct = mss.mss()
+    frame = sct.grab(sct.monitors[0])
+    image = Image.frombytes("RGB", frame.size, frame.bgra, "raw", "BGRX")
+    # Drop the raw BGRA frame before encoding so peak memory is the RGB
+    # image plus the encoded output, not all three.
+    del frame
+    if 0 < max_edge < max(image.size):
+        # Bilinear is several times faster than Lanczos and the model does
+        # not benefit from the sharper filter.
+        image.thumbnail((max_edge, max_edge), Image.Resampling.BILINEAR)
+    buf = io.BytesIO()
+    with image:
+        if _is_flat_screen(image):
+            mime_type = "image/png"
+            # Flat screens compress well even at the fastest zlib level.
+            image.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        else:
+            mime_type = "image/jpeg"
+            image.save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=False)
+    # getvalue() hands over the buffer without copying when no views exist;
+    # the SDK's Part.from_bytes requires real bytes, not a memoryview.
+    return buf.getvalue(), mime_type
+
+
 # ---------------------------------------------------------------------------
 # Gemini interaction
 
-def query_screenshot(
-    api_key: str,
+DESCRIBE_PROMPT = "Describe this screenshot for a blind user."
+# Passed to the SDK's httpx client: HTTP/2 multiplexes the streamed
+# response, and a longer keep-alive lets later presses reuse the connection.
+GEMINI_HTTP_CLIENT_ARGS = {
+    "http2": True,
+    "limits": httpx.Limits(keepalive_expiry=30),
+}
+# Request timeout in milliseconds. The SDK uses it for the httpx connect and
+# read timeouts and also sends it as X-Server-Timeout, which caps the whole
+# streamed generation on the server, so it leaves a wide margin over the
+# longest descriptions while still failing a stalled connection.
+GEMINI_HTTP_TIMEOUT_MS = 120_000
+SENTENCE_MAX_CHARS = 200
+SENTENCE_SCAN_MIN_CHARS = 20
+_SENTENCE_END_RE = re.compile(r'[.!?]\s')
+
+
+def _stream_response_text(
+    client: genai.Client,
     image_bytes: bytes,
     prompt: str,
     cancel_event: threading.Event | None = None,
-) -> str:
-    """Send screenshot and prompt to Gemini and return text response.
-
-    Parameters
-    ----------
-    api_key : str
-        The user's Gemini API key.
-    image_bytes : bytes
-        The raw bytes of the PNG image.
-    prompt : str
-        Instruction or question to answer about the screenshot.
+    mime_type: str = "image/png",
+) -> Iterator[str]:
+    """Yield Gemini response text chunks as they arrive.
 
-    Returns
-    -------
-    str
-        The model's textual response. If an error
-        occurs, an appropriate message is returned instead.
+    Iteration stops quietly once ``cancel_event`` is set. API errors are
+    raised to the caller.
     """
-    if not hasattr(query_screenshot, "_active_client_lock"):
-        query_screenshot._active_client_lock = threading.Lock()
-    if not hasattr(query_screenshot, "_active_client"):
-        query_screenshot._active_client = None
-    if cancel_event is not None and cancel_event.is_set():
-        return "Request canceled."
-    # We create a client per request to ensure resources are freed.
-    try:
-        client = genai.Client(api_key=api_key)
-    except Exception as exc:
-        logging.error(f"Failed to instantiate Gemini client: {exc}")
-        return "Failed to initialise the Gemini client."
+    stream = None
     try:
-        with query_screenshot._active_client_lock:
-            query_screenshot._active_client = client
         contents = [
             prompt,
-            types.Part.from_bytes(data=image_bytes, mime_type='image/png'),
+            types.Part.from_bytes(data=image_bytes, mime_type=mime_type),
         ]
-        response_text = ""
-        for chunk in client.models.generate_content_stream(
+        stream = client.models.generate_content_stream(
             model='gemini-2.5-flash', contents=contents
-        ):
+        )
+        with _stream_response_text._active_stream_lock:
+            _stream_response_text._active_stream = stream
+        for chunk in stream:
             if cancel_event is not None and cancel_event.is_set():
                 logging.info("Gemini request canceled by user.")
-                return "Request canceled."
-            response_text += chunk.text or ""
-        if cancel_event is not None and cancel_event.is_set():
-            logging.info("Gemini request canceled after stream.")
-            return "Request canceled."
-        return response_text.strip() or "No description returned."
+                return
+            yield chunk.text or ""
+    finally:
+        with _stream_response_text._active_stream_lock:
+            if _stream_response_text._active_stream is stream:
+                _stream_response_text._active_stream = None
+        # Release the streamed response; the client itself stays open.
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+_stream_response_text._active_stream_lock = threading.Lock()
+_stream_response_text._active_stream = None
+
+
+def stream_sentences(
+    client: genai.Client | None,
+    image_bytes: bytes,
+    prompt: str,
+    cancel_event: threading.Event | None = None,
+    mime_type: str = "image/png",
+) -> Iterator[str]:
+    """Stream a Gemini response and yield it one sentence at a time.
+
+    Sentences are yielded as soon as they are complete so narration can
+    start before the model finishes. Errors and empty responses are
+    yielded as a single spoken message. Nothing more is yielded once
+    ``cancel_event`` is set.
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        return
+    if client is None:
+        yield "Failed to initialise the Gemini client."
+        return
+    buffer = ""
+    scanned = 0  # Offset up to which the buffer holds no sentence end.
+    yielded = False
+    try:
+        for text in _stream_response_text(
+            client, image_bytes, prompt, cancel_event, mime_type
+        ):
+            buffer += text
+            # Many chunks are a single token; wait for enough new text.
+            if len(buffer) - scanned < SENTENCE_SCAN_MIN_CHARS:
+                continue
+            while True:
+                match = _SENTENCE_END_RE.search(buffer, scanned)
+                if match:
+                    cut = match.end()
+                elif len(buffer) > SENTENCE_MAX_CHARS:
+                    # Avoid stalling on long unpunctuated text.
+                    cut = buffer.rfind(" ", 0, SENTENCE_MAX_CHARS) + 1
+                    cut = cut or SENTENCE_MAX_CHARS
+                else:
+                    # The final character may be a terminator still
+                    # waiting for its trailing whitespace.
+                    scanned = max(len(buffer) - 1, 0)
+                    break
+                sentence = buffer[:cut].strip()
+                buffer = buffer[cut:]
+                scanned = 0
+                if sentence:
+                    yielded = True
+                    yield sentence
     except Exception as exc:
         if cancel_event is not None and cancel_event.is_set():
             logging.info("Gemini request aborted after user cancel.")
-            return "Request canceled."
+            return
         logging.error(f"Error during Gemini API call: {exc}")
-        return f"Error describing image: {exc}"
-    finally:
-        with query_screenshot._active_client_lock:
-            if query_screenshot._active_client is client:
-                query_screenshot._active_client = None
-        # Ensure the underlying HTTP connections are closed.
-        try:
-            client.close()
-        except Exception:
-            pass
-
-
-def cancel_active_query() -> None:
-    """Cancel active Gemini request if one is currently running."""
-    if not hasattr(query_screenshot, "_active_client_lock"):
+        yield f"Error describing image: {exc}"
         return
-    with query_screenshot._active_client_lock:
-        active_client = query_screenshot._active_client
-    if active_client is None:
+    if cancel_event is not None and cancel_event.is_set():
         return
+    tail = buffer.strip()
+    if tail:
+        yield tail
+    elif not yielded:
+        yield "No description returned."
+
+
+def cancel_active_query() -> bool:
+    """Cancel active Gemini request if one is currently running.
+
+    Returns True when the stream is busy in a read on another thread and
+    could not be closed. The request then ends at its next chunk; the
+    caller may also close the shared client as a best-effort way to end
+    the read sooner.
+    """
+    with _stream_response_text._active_stream_lock:
+        active_stream = _stream_response_text._active_stream
+    if active_stream is None:
+        return False
     try:
-        active_client.close()
+        active_stream.close()
         logging.info("Canceled active Gemini request.")
+    except ValueError:
+        logging.info("Gemini stream busy; it ends at the next chunk at the latest.")
+        return True
     except Exception as exc:
         logging.error(f"Failed to cancel active Gemini request: {exc}")
+    return False
 
 
-def describe_screenshot(
-    api_key: str,
-    image_bytes: bytes,
-    cancel_event: threading.Event | None = None,
-) -> str:
-    """Describe screenshot content for a visually impaired user."""
-    return query_screenshot(
-        api_key,
-        image_bytes,
-        "Describe this screenshot for a blind user.",
-        cancel_event=cancel_event,
-    )
+# Speech text normalization tables and patterns, built once at import.
+# Markdown markers and newlines become spaces; runs collapse afterwards.
+_MARKDOWN_TABLE = str.maketrans({c: " " for c in "*_`#\n"})
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
 
 # ---------------------------------------------------------------------------
 # Hot‑key functionality
+#
+# Hot-keys are registered with the Win32 RegisterHotKey API. Windows then
+# posts WM_HOTKEY only for the registered chords, instead of every keystroke
+# in the system passing through a low-level keyboard hook in Python.
+
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_NOREPEAT = 0x4000
+WM_QUIT = 0x0012
+WM_HOTKEY = 0x0312
+
+_MODIFIER_FLAGS = {"ctrl": MOD_CONTROL, "shift": MOD_SHIFT, "alt": MOD_ALT}
+_VIRTUAL_KEYS = {"left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28}
+
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+_user32.RegisterHotKey.restype = wintypes.BOOL
+_user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+_user32.UnregisterHotKey.restype = wintypes.BOOL
+_user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+_user32.GetMessageW.restype = wintypes.BOOL
+_user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_user32.PostThreadMessageW.restype = wintypes.BOOL
+
+
+def parse_hotkey(combo: str) -> tuple[int, int]:
+    """Convert a hot-key such as 'ctrl+shift+q' to (modifiers, virtual key)."""
+    modifiers = MOD_NOREPEAT
+    virtual_key = 0
+    for part in combo.lower().split("+"):
+        if part in _MODIFIER_FLAGS:
+            modifiers |= _MODIFIER_FLAGS[part]
+        elif part in _VIRTUAL_KEYS:
+            virtual_key = _VIRTUAL_KEYS[part]
+        elif len(part) == 1 and part.isalnum():
+            virtual_key = ord(part.upper())
+        else:
+            raise ValueError(f"Unsupported hot-key: {combo}")
+    if not virtual_key:
+        raise ValueError(f"Hot-key has no main key: {combo}")
+    return modifiers, virtual_key
+
+
+class HotkeyListener:
+    """Register global hot-keys and dispatch WM_HOTKEY messages to callbacks.
+
+    Registration and the message loop run on one dedicated thread because
+    Windows posts WM_HOTKEY to the thread that registered the hot-key.
+    Callbacks run on that thread in press order, so they must return
+    quickly and hand blocking work to a worker.
+    """
+
+    def __init__(self) -> None:
+        self._requested: list[tuple[str, Callable[[], None]]] = []
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._thread: threading.Thread | None = None
+        self._thread_id = 0
+        self._ready = threading.Event()
+
+    def add_hotkey(self, combo: str, callback: Callable[[], None]) -> None:
+        """Queue a hot-key for registration when the listener starts."""
+        self._requested.append((combo, callback))
+
+    def start(self) -> None:
+        """Start the message loop thread and wait for registration."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=2.0)
+
+    def stop(self) -> None:
+        """Stop the message loop; hot-keys are unregistered on its thread."""
+        if self._thread_id:
+            _user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+
+    def _run(self) -> None:
+        self._thread_id = threading.get_native_id()
+        for hotkey_id, (combo, callback) in enumerate(self._requested, start=1):
+            modifiers, virtual_key = parse_hotkey(combo)
+            if _user32.RegisterHotKey(None, hotkey_id, modifiers, virtual_key):
+                self._callbacks[hotkey_id] = callback
+            else:
+                logging.error(
+                    f"Failed to register hot-key {combo} "
+                    f"(error {ctypes.get_last_error()}); it may be in use."
+                )
+        self._ready.set()
+        msg = wintypes.MSG()
+        try:
+            while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message != WM_HOTKEY:
+                    continue
+                callback = self._callbacks.get(msg.wParam)
+                if callback is None:
+                    continue
+                try:
+                    callback()
+                except Exception as exc:
+                    logging.error(f"Hot-key callback failed: {exc}")
+        finally:
+            for hotkey_id in self._callbacks:
+                _user32.UnregisterHotKey(None, hotkey_id)
+            self._callbacks.clear()
+
 
 class VisionAssistant:
     """Main application class that orchestrates hot‑key handling and
@@ -843,9 +1318,16 @@ class VisionAssistant:
         self.active_log_path = configure_logging()
         self.conf = load_config()
         self.api_key: str | None = get_api_key(self.conf)
-        self.engine = init_speech_engine()
+        self._genai_client: genai.Client | None = None
+        self._genai_client_lock = threading.Lock()
+        atexit.register(self._close_genai_client)
+        # Created on the speech thread, which is the only thread that
+        # drives it; pyttsx3/SAPI5 engines are not thread-safe.
+        self.engine: pyttsx3.Engine | None = None
         self.running = True
+        self._shutdown_event = threading.Event()
         self._capture_lock = threading.Lock()
+        self._api_key_prompt_lock = threading.Lock()
         self._task_cancel_event = threading.Event()
         self._task_state_lock = threading.Lock()
         self._active_task_name: str | None = None
@@ -854,20 +1336,82 @@ class VisionAssistant:
         self._description_sections: list[str] = []
         self._current_detail_index: int = -1
         self._state_lock = threading.Lock()
+        self._speech_queue: queue.Queue[
+            tuple[str, bool, threading.Event | None]
+        ] = queue.Queue()
+        self._speech_thread = threading.Thread(target=self._speech_loop, daemon=True)
+        self._speech_thread.start()
+        # Reused worker threads for hot-key tasks instead of a thread per press.
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="va")
         logging.info(f"Application started. Primary log: {self.active_log_path}")
         self.show_instructions()
         # Register hot-keys
-        keyboard.add_hotkey('ctrl+m', self._on_capture_hotkey)
-        keyboard.add_hotkey('ctrl+n', self._on_follow_up_hotkey)
-        keyboard.add_hotkey('ctrl+shift+s', self._on_stop_speaking_hotkey)
-        keyboard.add_hotkey('ctrl+shift+x', self._on_cancel_task_hotkey)
-        keyboard.add_hotkey('ctrl+alt+k', self._on_set_api_key_hotkey)
-        keyboard.add_hotkey('ctrl+right', self._on_next_detail_hotkey)
-        keyboard.add_hotkey('ctrl+down', self._on_next_detail_hotkey)
-        keyboard.add_hotkey('ctrl+left', self._on_previous_detail_hotkey)
-        keyboard.add_hotkey('ctrl+up', self._on_previous_detail_hotkey)
-        keyboard.add_hotkey('ctrl+shift+q', self.stop)
-        self._ensure_api_key_configured()
+        hotkeys: dict[str, Callable[[], None]] = {
+            'ctrl+m': self._on_capture_hotkey,
+            'ctrl+alt+n': self._on_follow_up_hotkey,
+            'ctrl+shift+s': self._on_stop_speaking_hotkey,
+            'ctrl+shift+x': self._on_cancel_task_hotkey,
+            'ctrl+alt+k': self._on_set_api_key_hotkey,
+            'ctrl+alt+shift+right': self._on_next_detail_hotkey,
+            'ctrl+alt+shift+down': self._on_next_detail_hotkey,
+            'ctrl+alt+shift+left': self._on_previous_detail_hotkey,
+            'ctrl+alt+shift+up': self._on_previous_detail_hotkey,
+            'ctrl+shift+q': self.stop,
+        }
+        # Handlers run in press order on the listener thread and only claim
+        # the task slot there; capture, follow-up and the API key prompt run
+        # on the worker pool so stop, cancel and stop-speaking keys are never
+        # queued behind them.
+        self._hotkeys = HotkeyListener()
+        for combo, callback in hotkeys.items():
+            self._hotkeys.add_hotkey(combo, callback)
+        self._hotkeys.start()
+        with self._api_key_prompt_lock:
+            self._ensure_api_key_configured()
+
+    def _speech_loop(self) -> None:
+        """Speak queued utterances in order on a dedicated thread.
+
+        All narration goes through this one thread, which also owns the
+        pyttsx3 engine, so utterances never interleave across workers.
+        """
+        try:
+            self.engine = init_speech_engine()
+        except Exception as exc:
+            logging.error(f"Failed to initialise pyttsx3 engine: {exc}")
+        while True:
+            text, interrupt, done = self._speech_queue.get()
+            try:
+                speak(self.engine, text, interrupt=interrupt)
+            except Exception as exc:
+                logging.error(f"Queued speech failed: {exc}")
+            finally:
+                if done is not None:
+                    done.set()
+
+    def _queue_speech(
+        self,
+        text: str,
+        interrupt: bool = False,
+        wait: bool = False,
+    ) -> None:
+        """Queue text for the speech thread, optionally waiting for playback."""
+        done = threading.Event() if wait else None
+        self._speech_queue.put((text, interrupt, done))
+        if done is not None:
+            done.wait()
+
+    def _interrupt_speech(self) -> None:
+        """Drop queued narration and stop the current utterance."""
+        while True:
+            try:
+                _, _, done = self._speech_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Release any caller waiting on an utterance that was dropped.
+            if done is not None:
+                done.set()
+        stop_current_speech(self.engine)
 
     def show_instructions(self) -> None:
         """Display and speak usage instructions."""
@@ -876,36 +1420,41 @@ class VisionAssistant:
             "\n"
             "Instructions:\n"
             "  - Press CTRL+M at any time to capture the screen and hear a summary.\n"
-            "  - Press CTRL+N to start a voice follow-up question.\n"
-            "  - Press CTRL+N again to stop recording and send it immediately.\n"
+            "  - Press CTRL+ALT+N to start a voice follow-up question.\n"
+            "  - Press CTRL+ALT+N again to stop recording and send it immediately.\n"
             "  - Press CTRL+SHIFT+S anytime to stop current speech immediately.\n"
             "  - Press CTRL+SHIFT+X to cancel the current capture or follow-up task.\n"
             "  - You will hear periodic ticks while AI analysis is in progress.\n"
             "  - Press CTRL+ALT+K to set or update Gemini API key.\n"
-            "  - Press CTRL+RIGHT or CTRL+DOWN for the next detail.\n"
-            "  - Press CTRL+LEFT or CTRL+UP for the previous detail.\n"
+            "  - Press CTRL+ALT+SHIFT+RIGHT or CTRL+ALT+SHIFT+DOWN for the next detail.\n"
+            "  - Press CTRL+ALT+SHIFT+LEFT or CTRL+ALT+SHIFT+UP for the previous detail.\n"
             "  - Press CTRL+SHIFT+Q to exit the application.\n"
             "  - If API key is missing, the app will prompt you and encrypt it automatically.\n"
             f"  - Config file is auto-created at '{CONFIG_PATH}'.\n"
             f"  - Logs are stored in '{self.active_log_path}'.\n"
         )
         print(instructions)
-        # Speak asynchronously in another thread to avoid blocking
-        threading.Thread(target=speak, args=(self.engine, instructions), daemon=True).start()
+        # Queue for the speech thread to avoid blocking
+        self._queue_speech(instructions)
 
     def _on_capture_hotkey(self) -> None:
         """Callback executed when the capture hot?key is pressed."""
-        stop_current_speech(self.engine)
-        if not self._capture_lock.acquire(timeout=0.8):
+        self._interrupt_speech()
+        if not self._capture_lock.acquire(blocking=False):
             print("Capture already in progress. Press Ctrl+Shift+X to cancel it.")
-            play_beep_pattern([(420, 90), (380, 90)])
+            play_beep_pattern(_BEEP_BUSY)
             return
         clear_speech_stop_request()
         self._task_cancel_event.clear()
         self._set_active_task("capture")
-        play_beep_pattern([(740, 60), (900, 70)])
+        play_beep_pattern(_BEEP_CAPTURE)
         print("Hotkey detected: capturing screen...")
-        threading.Thread(target=self._capture_and_describe, daemon=True).start()
+        try:
+            self._executor.submit(self._capture_and_describe)
+        except RuntimeError:
+            # stop() shut the pool down after this press claimed the slot.
+            self._set_active_task(None)
+            self._capture_lock.release()
 
     def _on_follow_up_hotkey(self) -> None:
         """Capture voice follow-up question and answer based on current screen."""
@@ -913,27 +1462,36 @@ class VisionAssistant:
             self._follow_up_submit_event.set()
             cancel_active_transcription()
             print("Stopping recording and sending your follow-up question...")
-            play_audio_cue("SystemAsterisk", [(980, 90), (1180, 110)])
+            # play_audio_cue blocks for the sound's length; keep it off the
+            # hot-key thread.
+            self._executor.submit(
+                play_audio_cue, "SystemAsterisk", _BEEP_RECORDING_SUBMIT
+            )
             return
-        stop_current_speech(self.engine)
-        if not self._capture_lock.acquire(timeout=0.8):
+        self._interrupt_speech()
+        if not self._capture_lock.acquire(blocking=False):
             print("Capture already in progress. Press Ctrl+Shift+X to cancel it.")
-            play_beep_pattern([(420, 90), (380, 90)])
+            play_beep_pattern(_BEEP_BUSY)
             return
         clear_speech_stop_request()
         self._task_cancel_event.clear()
         self._set_active_task("follow-up")
         self._follow_up_submit_event.clear()
-        play_beep_pattern([(760, 60), (1040, 80)])
+        play_beep_pattern(_BEEP_FOLLOW_UP)
         print("Follow-up hotkey detected: preparing voice recording...")
-        threading.Thread(target=self._handle_follow_up_query, daemon=True).start()
+        try:
+            self._executor.submit(self._handle_follow_up_query)
+        except RuntimeError:
+            # stop() shut the pool down after this press claimed the slot.
+            self._set_active_task(None)
+            self._capture_lock.release()
 
     def _on_stop_speaking_hotkey(self) -> None:
         """Interrupt the current narration immediately."""
         logging.info("Speech stop hot-key pressed")
-        stop_current_speech(self.engine)
+        self._interrupt_speech()
         print("Speech stopped. You can trigger the next action now.")
-        play_beep_pattern([(500, 70), (420, 90)])
+        play_beep_pattern(_BEEP_SPEECH_STOPPED)
 
     def _set_active_task(self, task_name: str | None) -> None:
         """Track the currently running long task for cancellation feedback."""
@@ -952,15 +1510,24 @@ class VisionAssistant:
         self._follow_up_submit_event.set()
         self._follow_up_listening_event.clear()
         cancel_active_transcription()
-        cancel_active_query()
-        stop_current_speech(self.engine)
+        if cancel_active_query():
+            # Best-effort abort of a read in progress. Client.close() reaches
+            # httpcore's HTTP/2 connection close(), which takes no lock and
+            # just closes the socket, so it never waits on the reading worker.
+            # On Windows closing a socket fails a recv blocked on it in
+            # another thread; if the read survives anyway, the worker still
+            # stops at the next chunk because the cancel event is set. Errors
+            # raised after cancel are not spoken, and the next request builds
+            # a fresh client.
+            self._close_genai_client()
+        self._interrupt_speech()
         if active_task:
             logging.info(f"Task cancel hot-key pressed. Active task: {active_task}")
             print(f"{active_task.capitalize()} task canceled. Ready for next command.")
         else:
             logging.info("Task cancel hot-key pressed with no active long task.")
             print("No capture task was running. Speech was stopped.")
-        play_beep_pattern([(460, 70), (390, 90), (320, 110)])
+        play_beep_pattern(_BEEP_TASK_CANCELED)
 
     def _record_follow_up_question(
         self,
@@ -969,14 +1536,13 @@ class VisionAssistant:
     ) -> str | None:
         """Record follow-up dictation in chunks so users can submit early."""
         chunks: list[str] = []
-        started_at = time.time()
-        while (time.time() - started_at) < max_record_seconds:
+        deadline = time.monotonic() + max_record_seconds
+        while (remaining := deadline - time.monotonic()) > 0:
             if self._task_cancel_event.is_set():
                 return None
             if self._follow_up_submit_event.is_set():
                 break
-            remaining = max_record_seconds - int(time.time() - started_at)
-            timeout = max(1, min(chunk_seconds, remaining))
+            timeout = max(1, min(chunk_seconds, int(remaining)))
             chunk = transcribe_from_microphone(
                 timeout_seconds=timeout,
                 cancel_event=self._task_cancel_event,
@@ -995,84 +1561,99 @@ class VisionAssistant:
             return None
         return " ".join(chunks)
 
-    def _capture_screenshot_bytes(self) -> bytes | None:
-        """Capture current screen and return image bytes."""
+    def _max_screenshot_edge(self) -> int:
+        """Return the configured screenshot size cap in pixels."""
+        value = self.conf.get("max_screenshot_edge", DEFAULT_MAX_SCREENSHOT_EDGE)
         try:
-            screenshot = pyautogui.screenshot()
-            buf = io.BytesIO()
-            screenshot.save(buf, format='PNG')
-            return buf.getvalue()
+            return int(value)
+        except (TypeError, ValueError):
+            logging.error(f"Invalid max_screenshot_edge in config: {value!r}")
+            return DEFAULT_MAX_SCREENSHOT_EDGE
+
+    def _capture_screenshot_bytes(self) -> tuple[bytes, str] | None:
+        """Capture current screen and return image bytes and MIME type."""
+        try:
+            return grab_screenshot(self._max_screenshot_edge())
         except Exception as exc:
             logging.error(f"Failed to take screenshot: {exc}")
-            speak(self.engine, f"Failed to take screenshot: {exc}")
+            self._queue_speech(f"Failed to take screenshot: {exc}")
             print(f"Failed to take screenshot: {exc}")
-            play_beep_pattern([(420, 90), (380, 90), (340, 90)])
+            play_beep_pattern(_BEEP_ERROR)
             return None
 
     def _capture_and_describe(self) -> None:
         """Capture the current screen and announce a description."""
         progress_stop_event: threading.Event | None = None
         progress_thread: threading.Thread | None = None
+        cancelled = self._task_cancel_event.is_set
         try:
             logging.info("Capture hot?key pressed")
-            if self._task_cancel_event.is_set():
+            if cancelled():
                 logging.info("Capture task canceled before execution.")
                 return
             if not self.api_key:
-                self._ensure_api_key_configured()
+                # Waits for an open Ctrl+Alt+K prompt instead of opening a
+                # second one.
+                with self._api_key_prompt_lock:
+                    self._ensure_api_key_configured()
                 if not self.api_key:
                     message = (
                         "API key is still missing. Please provide it when prompted, "
                         "or update config.json and try again."
                     )
-                    speak(self.engine, message)
+                    self._queue_speech(message)
                     print(message)
-                    play_beep_pattern([(420, 90), (380, 90), (340, 90)])
+                    play_beep_pattern(_BEEP_ERROR)
                     return
-            if self._task_cancel_event.is_set():
+            if cancelled():
                 print("Capture canceled.")
                 return
-            img_bytes = self._capture_screenshot_bytes()
-            if not img_bytes:
+            screenshot = self._capture_screenshot_bytes()
+            if not screenshot:
                 return
-            if self._task_cancel_event.is_set():
+            img_bytes, mime_type = screenshot
+            if cancelled():
                 print("Capture canceled.")
                 return
-            play_beep_pattern([(1100, 70)])
+            play_beep_pattern(_BEEP_PROCESSING)
             # Send to Gemini and speak the description
             print("Analyzing screenshot. Please wait...")
             progress_stop_event = threading.Event()
             progress_thread = start_progress_beep_loop(progress_stop_event)
-            description = describe_screenshot(
-                self.api_key,
+            # Narrate the summary sentence by sentence while Gemini streams.
+            sentences: list[str] = []
+            for sentence in stream_sentences(
+                self._get_genai_client(),
                 img_bytes,
+                DESCRIBE_PROMPT,
                 cancel_event=self._task_cancel_event,
-            )
-            progress_stop_event.set()
-            if progress_thread.is_alive():
-                progress_thread.join(timeout=0.2)
-            if self._task_cancel_event.is_set():
+                mime_type=mime_type,
+            ):
+                if not sentences:
+                    progress_stop_event.set()
+                    print("Speaking summary now...")
+                    play_beep_pattern(_BEEP_RESPONSE_READY)
+                    self._queue_speech("Summary is ready.", interrupt=True)
+                    self._queue_speech(
+                        f"Summary. {self._normalize_for_speech(sentence)}"
+                    )
+                elif len(sentences) < 2:
+                    self._queue_speech(self._normalize_for_speech(sentence))
+                sentences.append(sentence)
+            if cancelled():
                 logging.info("Capture task canceled while waiting for model response.")
                 print("Capture canceled.")
                 return
+            description = " ".join(sentences)
             logging.info(f"Gemini description: {description}")
             print(f"Gemini description: {description}")
-            self._store_description_details(description)
-            summary = self._build_summary(description)
-            print("Speaking summary now...")
-            play_beep_pattern([(1250, 90), (1500, 120)])
-            speak(self.engine, "Summary is ready.", interrupt=True)
-            speak(self.engine, f"Summary. {summary}")
-            speak(
-                self.engine,
-                "Press control plus right arrow for next detail. "
-                "Press control plus left arrow for previous detail.",
+            self._store_description_details(self._split_description(description))
+            self._queue_speech(
+                "Press control plus alt plus shift plus right arrow for next detail. "
+                "Press control plus alt plus shift plus left arrow for previous detail."
             )
         finally:
-            if progress_stop_event is not None:
-                progress_stop_event.set()
-            if progress_thread is not None and progress_thread.is_alive():
-                progress_thread.join(timeout=0.2)
+            stop_progress_beep_loop(progress_stop_event, progress_thread)
             self._set_active_task(None)
             self._capture_lock.release()
 
@@ -1080,65 +1661,70 @@ class VisionAssistant:
         """Handle follow-up voice question for current screen."""
         progress_stop_event: threading.Event | None = None
         progress_thread: threading.Thread | None = None
+        cancelled = self._task_cancel_event.is_set
         try:
             logging.info("Follow-up hotkey pressed")
-            if self._task_cancel_event.is_set():
+            if cancelled():
                 logging.info("Follow-up task canceled before execution.")
                 return
             if not self.api_key:
-                self._ensure_api_key_configured()
+                # Waits for an open Ctrl+Alt+K prompt instead of opening a
+                # second one.
+                with self._api_key_prompt_lock:
+                    self._ensure_api_key_configured()
                 if not self.api_key:
                     message = (
                         "API key is still missing. Please provide it when prompted, "
                         "or update config.json and try again."
                     )
-                    speak(self.engine, message)
+                    self._queue_speech(message)
                     print(message)
-                    play_beep_pattern([(420, 90), (380, 90), (340, 90)])
+                    play_beep_pattern(_BEEP_ERROR)
                     return
-            speak(
-                self.engine,
+            self._queue_speech(
                 "Recording mode. Ask your follow-up question after the beep. "
-                "Press control plus N again to send immediately.",
+                "Press control plus alt plus N again to send immediately.",
+                wait=True,
             )
-            if self._task_cancel_event.is_set():
+            if cancelled():
                 print("Follow-up canceled.")
                 return
-            print("Follow-up recording started. Speak now, then press Ctrl+N to send.")
+            print("Follow-up recording started. Speak now, then press Ctrl+Alt+N to send.")
             self._follow_up_submit_event.clear()
             self._follow_up_listening_event.set()
-            play_audio_cue("SystemExclamation", [(1320, 140), (1560, 170)])
+            play_audio_cue("SystemExclamation", _BEEP_RECORDING_START)
             transcript = self._record_follow_up_question(
                 max_record_seconds=30,
                 chunk_seconds=3,
             )
             self._follow_up_listening_event.clear()
-            play_audio_cue("SystemAsterisk", [(900, 80), (1060, 100)])
-            if self._task_cancel_event.is_set():
+            play_audio_cue("SystemAsterisk", _BEEP_RECORDING_END)
+            if cancelled():
                 logging.info("Follow-up canceled during question recording.")
                 print("Follow-up canceled.")
                 return
             if not transcript:
                 message = (
                     "I could not understand the question. "
-                    "Please press control plus N and try again."
+                    "Please press control plus alt plus N and try again."
                 )
                 print(message)
-                speak(self.engine, message)
-                play_beep_pattern([(420, 90), (380, 90)])
+                self._queue_speech(message)
+                play_beep_pattern(_BEEP_BUSY)
                 return
             logging.info(f"Follow-up transcript: {transcript}")
             print(f"Follow-up question: {transcript}")
-            if self._task_cancel_event.is_set():
+            if cancelled():
                 print("Follow-up canceled.")
                 return
-            img_bytes = self._capture_screenshot_bytes()
-            if not img_bytes:
+            screenshot = self._capture_screenshot_bytes()
+            if not screenshot:
                 return
-            if self._task_cancel_event.is_set():
+            img_bytes, mime_type = screenshot
+            if cancelled():
                 print("Follow-up canceled.")
                 return
-            play_beep_pattern([(1100, 70)])
+            play_beep_pattern(_BEEP_PROCESSING)
             print("Analyzing follow-up question. Please wait...")
             progress_stop_event = threading.Event()
             progress_thread = start_progress_beep_loop(progress_stop_event)
@@ -1148,65 +1734,130 @@ class VisionAssistant:
                 "Be clear, concise, and practical. "
                 f"User question: {transcript}"
             )
-            answer = query_screenshot(
-                self.api_key,
+            # Speak the answer sentence by sentence while Gemini streams.
+            sentences: list[str] = []
+            for sentence in stream_sentences(
+                self._get_genai_client(),
                 img_bytes,
                 prompt,
                 cancel_event=self._task_cancel_event,
-            )
-            progress_stop_event.set()
-            if progress_thread.is_alive():
-                progress_thread.join(timeout=0.2)
-            if self._task_cancel_event.is_set():
+                mime_type=mime_type,
+            ):
+                if not sentences:
+                    progress_stop_event.set()
+                    play_beep_pattern(_BEEP_RESPONSE_READY)
+                    self._queue_speech(
+                        self._normalize_for_speech(sentence), interrupt=True
+                    )
+                else:
+                    self._queue_speech(self._normalize_for_speech(sentence))
+                sentences.append(sentence)
+            if cancelled():
                 logging.info("Follow-up canceled while waiting for model response.")
                 print("Follow-up canceled.")
                 return
+            answer = " ".join(sentences)
             logging.info(f"Follow-up answer: {answer}")
             print(f"Follow-up answer: {answer}")
-            play_beep_pattern([(1250, 90), (1500, 120)])
-            speak(self.engine, answer, interrupt=True)
         finally:
             self._follow_up_listening_event.clear()
             self._follow_up_submit_event.clear()
-            if progress_stop_event is not None:
-                progress_stop_event.set()
-            if progress_thread is not None and progress_thread.is_alive():
-                progress_thread.join(timeout=0.2)
+            stop_progress_beep_loop(progress_stop_event, progress_thread)
             self._set_active_task(None)
             self._capture_lock.release()
 
+    def _get_genai_client(self) -> genai.Client | None:
+        """Return the shared Gemini client, creating it on first use."""
+        with self._genai_client_lock:
+            if self._genai_client is None and self.api_key:
+                try:
+                    self._genai_client = genai.Client(
+                        api_key=self.api_key,
+                        http_options=types.HttpOptions(
+                            timeout=GEMINI_HTTP_TIMEOUT_MS,
+                            client_args=GEMINI_HTTP_CLIENT_ARGS,
+                        ),
+                    )
+                except Exception as exc:
+                    logging.error(f"Failed to instantiate Gemini client: {exc}")
+            return self._genai_client
+
+    def _close_genai_client(self) -> None:
+        """Close the shared Gemini client so the next request rebuilds it."""
+        with self._genai_client_lock:
+            client = self._genai_client
+            self._genai_client = None
+        if client is None:
+            return
+        try:
+            client.close()
+        except Exception as exc:
+            logging.error(f"Failed to close Gemini client: {exc}")
+
     def _on_set_api_key_hotkey(self) -> None:
         """Prompt user to set or update API key."""
-        stop_current_speech(self.engine)
+        self._interrupt_speech()
+        # The prompt blocks until answered; ignore repeat presses meanwhile.
+        if not self._api_key_prompt_lock.acquire(blocking=False):
+            print("API key prompt is already open.")
+            play_beep_pattern(_BEEP_BUSY)
+            return
         clear_speech_stop_request()
-        threading.Thread(target=self._set_api_key_from_hotkey, daemon=True).start()
+        try:
+            self._executor.submit(self._set_api_key_from_hotkey)
+        except RuntimeError:
+            # stop() shut the pool down after this press took the lock.
+            self._api_key_prompt_lock.release()
 
     def _set_api_key_from_hotkey(self) -> None:
         """Handle API key update triggered by hot-key."""
-        logging.info("API key update hot-key pressed")
-        play_beep_pattern([(950, 70), (1200, 90)])
-        self._ensure_api_key_configured(force_prompt=True)
+        try:
+            logging.info("API key update hot-key pressed")
+            play_beep_pattern(_BEEP_API_KEY_PROMPT)
+            self._ensure_api_key_configured(force_prompt=True)
+        finally:
+            self._api_key_prompt_lock.release()
+
+    def _prompt_for_api_key_until_shutdown(self) -> str | None:
+        """Run the key prompt on a daemon thread and give up on shutdown.
+
+        Neither ``input()`` nor the Tk dialog can be interrupted, so the
+        prompt runs on a daemon thread that never holds up process exit;
+        the caller stops waiting for it as soon as ``stop()`` runs.
+        """
+        result: list[str | None] = []
+        thread = threading.Thread(
+            target=lambda: result.append(prompt_for_api_key(CONFIG_PATH)),
+            daemon=True,
+        )
+        thread.start()
+        while thread.is_alive():
+            if not self.running:
+                logging.info("API key prompt abandoned at shutdown.")
+                return None
+            thread.join(timeout=0.2)
+        return result[0] if result else None
 
     def _ensure_api_key_configured(self, force_prompt: bool = False) -> None:
         """Ensure API key exists; if missing, prompt user and save encrypted."""
         if self.api_key and not force_prompt:
             return
         if force_prompt:
-            speak(
-                self.engine,
+            self._queue_speech(
                 "API key update requested. Please enter your Gemini API key now.",
+                wait=True,
             )
         else:
-            speak(
-                self.engine,
+            self._queue_speech(
                 "Gemini API key is not configured. Please enter it now.",
+                wait=True,
             )
-        entered_key = prompt_for_api_key(CONFIG_PATH)
+        entered_key = self._prompt_for_api_key_until_shutdown()
         if not entered_key:
             if force_prompt:
                 print("API key update canceled. Existing value unchanged.")
-                speak(self.engine, "API key update canceled.")
-                play_beep_pattern([(420, 90), (380, 90)])
+                self._queue_speech("API key update canceled.")
+                play_beep_pattern(_BEEP_BUSY)
             else:
                 print(
                     f"No API key provided. You can set it later in '{CONFIG_PATH}'."
@@ -1214,78 +1865,69 @@ class VisionAssistant:
             return
         saved_key = set_api_key(self.conf, entered_key)
         if not saved_key:
-            speak(
-                self.engine,
-                "Failed to save API key. Please update config.json manually.",
+            self._queue_speech(
+                "Failed to save API key. Please update config.json manually."
             )
             print(f"Failed to save API key in '{CONFIG_PATH}'.")
-            play_beep_pattern([(420, 90), (380, 90), (340, 90)])
+            play_beep_pattern(_BEEP_ERROR)
             return
         self.api_key = saved_key
+        self._close_genai_client()
         success_message = (
             f"API key saved and encrypted in '{CONFIG_PATH}'."
         )
         print(success_message)
         if force_prompt:
-            speak(self.engine, "API key updated successfully.")
+            self._queue_speech("API key updated successfully.")
         else:
-            speak(self.engine, "API key saved successfully.")
-        play_beep_pattern([(1200, 90), (1450, 120)])
+            self._queue_speech("API key saved successfully.")
+        play_beep_pattern(_BEEP_API_KEY_SAVED)
 
     def _normalize_for_speech(self, text: str) -> str:
         """Normalize model output so TTS reads it clearly."""
-        cleaned = text.replace("\n", " ")
-        cleaned = re.sub(r"[*_`#]+", " ", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        return cleaned
+        cleaned = text.translate(_MARKDOWN_TABLE)
+        return _WHITESPACE_RE.sub(" ", cleaned).strip()
 
-    def _store_description_details(self, description: str) -> None:
-        """Split Gemini output into detail chunks for keyboard navigation."""
+    def _split_description(self, description: str) -> list[str]:
+        """Normalize Gemini output once and split it into sentences."""
         normalized = self._normalize_for_speech(description)
-        parts = [p.strip() for p in re.split(r'(?<=[.!?])\s+', normalized) if p.strip()]
-        if not parts:
-            parts = [normalized or "No details available."]
+        parts = [p.strip() for p in _SENTENCE_SPLIT_RE.split(normalized) if p.strip()]
+        return parts or [normalized or "No details available."]
+
+    def _store_description_details(self, parts: list[str]) -> None:
+        """Store pre-split detail chunks for keyboard navigation."""
         with self._state_lock:
             self._description_sections = parts
             self._current_detail_index = -1
 
-    def _build_summary(self, description: str) -> str:
-        """Build a short summary from the first one or two sentences."""
-        normalized = self._normalize_for_speech(description)
-        parts = [p.strip() for p in re.split(r'(?<=[.!?])\s+', normalized) if p.strip()]
-        if not parts:
-            return normalized or "No description returned."
-        return " ".join(parts[:2])
-
     def _on_next_detail_hotkey(self) -> None:
         """Read the next detail chunk."""
-        stop_current_speech(self.engine)
-        if not self._capture_lock.acquire(timeout=0.8):
+        self._interrupt_speech()
+        if not self._capture_lock.acquire(blocking=False):
             print("Action still in progress. Please try again.")
-            play_beep_pattern([(420, 90), (380, 90)])
+            play_beep_pattern(_BEEP_BUSY)
             return
         clear_speech_stop_request()
-        threading.Thread(target=self._navigate_detail, args=(1,), daemon=True).start()
+        self._navigate_detail(1)
 
     def _on_previous_detail_hotkey(self) -> None:
         """Read the previous detail chunk."""
-        stop_current_speech(self.engine)
-        if not self._capture_lock.acquire(timeout=0.8):
+        self._interrupt_speech()
+        if not self._capture_lock.acquire(blocking=False):
             print("Action still in progress. Please try again.")
-            play_beep_pattern([(420, 90), (380, 90)])
+            play_beep_pattern(_BEEP_BUSY)
             return
         clear_speech_stop_request()
-        threading.Thread(target=self._navigate_detail, args=(-1,), daemon=True).start()
+        self._navigate_detail(-1)
 
     def _navigate_detail(self, step: int) -> None:
         """Move through indexed detail chunks and read the selected one aloud."""
         try:
+            # Hold the lock only to move the index; format and speak after.
             with self._state_lock:
                 details = self._description_sections
                 index = self._current_detail_index
-                if not details:
-                    message = "No details available yet. Press control plus M first."
-                else:
+                if details:
                     if index == -1:
                         index = 0 if step > 0 else len(details) - 1
                     elif step > 0 and index < len(details) - 1:
@@ -1293,13 +1935,16 @@ class VisionAssistant:
                     elif step < 0 and index > 0:
                         index -= 1
                     self._current_detail_index = index
-                    message = f"Detail {index + 1} of {len(details)}. {details[index]}"
+            if not details:
+                message = "No details available yet. Press control plus M first."
+            else:
+                message = f"Detail {index + 1} of {len(details)}. {details[index]}"
             print(message)
-            speak(self.engine, message)
+            self._queue_speech(message)
         finally:
             self._capture_lock.release()
 
-    def stop(self, speak_farewell: bool = True, force_exit: bool = True) -> None:
+    def stop(self, speak_farewell: bool = True) -> None:
         """Stop the application and clean up resources."""
         if not self.running:
             return
@@ -1310,33 +1955,36 @@ class VisionAssistant:
         self._follow_up_listening_event.clear()
         cancel_active_transcription()
         cancel_active_query()
+        self._close_genai_client()
         self._set_active_task(None)
         # Unregister hot-keys first so no more callbacks are queued.
-        keyboard.unhook_all_hotkeys()
+        self._hotkeys.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
         if speak_farewell:
-            stop_current_speech(self.engine)
+            self._interrupt_speech()
             clear_speech_stop_request()
-            speak(self.engine, "Exiting Vision Assistance App. Goodbye.")
-        if force_exit:
-            # Keep force-exit only for hot-key shutdown behavior.
-            time.sleep(0.2)
-            os._exit(0)
+            self._queue_speech("Exiting Vision Assistance App. Goodbye.", wait=True)
+        # Wake main() last so it returns, releases the instance mutex and lets
+        # the interpreter run its atexit cleanup.
+        self._shutdown_event.set()
 
 
 def main() -> None:
     """Entry point for the application."""
-    instance_lock = SingleInstanceLock(LOCK_PATH)
+    instance_lock = SingleInstanceLock(INSTANCE_MUTEX_NAME)
     if not instance_lock.acquire():
         print("Vision Assistance App is already running. Close the other instance first.")
         return
     assistant = VisionAssistant()
-    # Keep the main thread alive while the hot-key listener is running
+    # Keep the main thread alive until stop() sets the shutdown event. The
+    # timeout only lets Windows deliver Ctrl+C, which cannot interrupt an
+    # untimed wait; shutdown itself wakes the wait immediately.
     try:
-        while assistant.running:
-            time.sleep(0.1)
+        while not assistant._shutdown_event.wait(timeout=1.0):
+            pass
     except KeyboardInterrupt:
         print("\nKeyboard interrupt received. Stopping...")
-        assistant.stop(speak_farewell=False, force_exit=False)
+        assistant.stop(speak_farewell=False)
     finally:
         instance_lock.release()
 